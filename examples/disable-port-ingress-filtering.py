@@ -14,7 +14,12 @@ if "Ethernet Routing Switch 55" not in s.sysDescr:
     print("Not a 5510")
     sys.exit(1)
 
-for id in s.dot1qPortIngressFiltering:
-    if s.dot1qPortIngressFiltering[id]:
-        print("Filtering on port %d of %s is not disabled, disable it." % (id, sys.argv[1]))
+# Walk the column once to find the ports to change
+ports = [id for id, filtering in s.dot1qPortIngressFiltering.iteritems()
+         if filtering]
+
+# Disable filtering on all those ports with a single request
+with s:
+    for id in ports:
+        print(f"Filtering on port {id:d} of {sys.argv[1]} is not disabled, disable it.")
         s.dot1qPortIngressFiltering[id] = False
@@ -3,56 +3,88 @@
 """Enable LLDP.
 
 Generic procedure but we restrict ourself to Nortel 55x0.
+
+Usage:
+ ./enable-lldp.py host [host ...] community
+
+Hosts are processed concurrently.
 """
 
 import sys
-import os
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 load("SNMPv2-MIB")
 for l in ["LLDP", "LLDP-EXT-DOT3", "LLDP-EXT-DOT1"]:
-    load(os.path.expanduser("~/.snmp/mibs/%s-MIB" % l))
+    load(f"{l}-MIB")
 
-s = M(host=sys.argv[1], community=sys.argv[2])
 
-try:
-    type = s.sysDescr
-except snmp.SNMPException:
-    print("Cannot process %s: bad community?" % sys.argv[1])
-    sys.exit(1)
-if not type.startswith(("Ethernet Routing Switch 55",
-                        "Ethernet Switch 425")):
-    print("Not a 55x0: %s" % type)
-    sys.exit(1)
+def process(host, community):
+    # A manager should only be used from the thread that created it
+    s = M(host=host, community=community)
+
+    try:
+        type = s.sysDescr
+    except snmp.SNMPException:
+        print(f"Cannot process {host}: bad community?")
+        return 1
+    if not type.startswith(("Ethernet Routing Switch 55",
+                            "Ethernet Switch 425")):
+        print(f"{host}: not a 55x0: {type}")
+        return 1
 
-print("Processing %s..." % sys.argv[1])
-try:
-    for oid in s.lldpConfigManAddrPortsTxEnable:
-        if oid[0] == "ipV4":
+    print(f"Processing {host}...")
+    try:
+        # Only walk the IPv4 addresses
+        for oid in s.lldpConfigManAddrPortsTxEnable["ipV4"]:
             s.lldpConfigManAddrPortsTxEnable[oid] = "\xff"*10
-except snmp.SNMPNoSuchObject:
-    print("No LLDP for this switch")
-    sys.exit(2)
-dot3 = True
-for port in s.lldpPortConfigAdminStatus:
-    s.lldpPortConfigAdminStatus[port] = "txAndRx"
-    s.lldpPortConfigTLVsTxEnable[port] = ["portDesc",
-                                          "sysName",
-                                          "sysDesc",
-                                          "sysCap" ]
-    # Dot3
+    except snmp.SNMPNoSuchObject:
+        print(f"No LLDP for {host}")
+        return 2
+
+    def configure(port, dot3):
+        # Send all the settings of a port in a single request
+        with s:
+            s.lldpPortConfigAdminStatus[port] = "txAndRx"
+            s.lldpPortConfigTLVsTxEnable[port] = ["portDesc",
+                                                  "sysName",
+                                                  "sysDesc",
+                                                  "sysCap" ]
+            if dot3:
+                s.lldpXdot3PortConfigTLVsTxEnable[port] = ["macPhyConfigStatus",
+                                                           "powerViaMDI",
+                                                           "linkAggregation",
+                                                           "maxFrameSize"]
+
+    dot3 = True
+    for port in s.lldpPortConfigAdminStatus:
+        try:
+            configure(port, dot3)
+        except snmp.SNMPException:
+            if not dot3:
+                raise
+            print(f"No Dot3 for {host}")
+            dot3 = False
+            configure(port, dot3)
+    # Dot1
     try:
-        if dot3:
-            s.lldpXdot3PortConfigTLVsTxEnable[port] = ["macPhyConfigStatus",
-                                                       "powerViaMDI",
-                                                       "linkAggregation",
-                                                       "maxFrameSize"]
+        with s:
+            for port,vlan in s.lldpXdot1ConfigVlanNameTxEnable:
+                s.lldpXdot1ConfigVlanNameTxEnable[port, vlan] = True
     except snmp.SNMPException:
-        print("No Dot3")
-        dot3 = False
-# Dot1
-try:
-    for port,vlan in s.lldpXdot1ConfigVlanNameTxEnable:
-        s.lldpXdot1ConfigVlanNameTxEnable[port, vlan] = True
-except snmp.SNMPException:
-    print("No Dot1")
-print("Success!")
+        print(f"No Dot1 for {host}")
+    print(f"Success for {host}!")
+    return 0
+
+
+if len(sys.argv) < 3:
+    print(__doc__.strip())
+    sys.exit(1)
+
+# When run by snimpy, top-level names are not visible from a lambda:
+# hand them over explicitly.
+hosts = sys.argv[1:-1]
+community = sys.argv[-1]
+with ThreadPoolExecutor(max_workers=16) as executor:
+    results = list(executor.map(process, hosts, itertools.repeat(community)))
+sys.exit(max(results, default=0))
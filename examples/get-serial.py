@@ -12,19 +12,22 @@ host=sys.argv[1]
 s = M(host=host, community=sys.argv[2])
 
 # Locate parent of all other elements
-print("[-] %s: Search for parent element" % host)
+print(f"[-] {host}: Search for parent element")
 parent = None
-for i in s.entPhysicalContainedIn:
-    if s.entPhysicalContainedIn[i] == 0:
+for i, container in s.entPhysicalContainedIn.iteritems():
+    if container == 0:
         parent = i
         break
 if parent is None:
-    print("[!] %s: Unable to find parent" % host)
+    print(f"[!] {host}: Unable to find parent")
     sys.exit(1)
-print("[+] {}: {}".format(host, s.entPhysicalDescr[parent]))
-print("[+] {}: HW {}, FW {}, SW {}".format(host,
-                                           s.entPhysicalHardwareRev[parent],
-                                           s.entPhysicalFirmwareRev[parent],
-                                           s.entPhysicalSoftwareRev[parent]))
-print("[+] {}: SN {}".format(host,
-                             s.entPhysicalSerialNum[parent]))
+# Retrieve all the information with a single request
+descr, hw, fw, sw, sn = s.entPhysicalTable.getrow(parent,
+                                                  "entPhysicalDescr",
+                                                  "entPhysicalHardwareRev",
+                                                  "entPhysicalFirmwareRev",
+                                                  "entPhysicalSoftwareRev",
+                                                  "entPhysicalSerialNum")
+print(f"[+] {host}: {descr}")
+print(f"[+] {host}: HW {hw}, FW {fw}, SW {sw}")
+print(f"[+] {host}: SN {sn}")
@@ -3,5 +3,5 @@
 load("IF-MIB")
 m=M()
 
-for i in m.ifDescr:
-    print("Interface %3d:   %s" % (i, m.ifDescr[i]))
+for i, descr in m.ifDescr.iteritems():
+    print(f"Interface {i:3d}:   {descr}")
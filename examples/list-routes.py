@@ -6,18 +6,21 @@ load("IP-FORWARD-MIB")
 m=M()
 
 print("Using IP-FORWARD-MIB::ipCidrRouteTable...")
-routes = m.ipCidrRouteNextHop
-for x in routes:
+for x, nexthop in m.ipCidrRouteNextHop.iteritems():
     net, netmask, tos, src = x
-    print("{:>15}/{:<15} via {:<15} src {:<15}".format(net, netmask, routes[x], src))
+    print(f"{net!s:>15}/{netmask!s:<15} via {nexthop!s:<15} src {src!s:<15}")
 
-print
+print()
 
 print("Using IP-FORWARD-MIB::inetCidrRouteTable...")
-routes = m.inetCidrRouteIfIndex
-for x in routes:
+# Many routes share the same next-hop, only format it once
+nexthops = {}
+for x in m.inetCidrRouteIfIndex:
     dsttype, dst, prefix, oid, nhtype, nh = x
     if dsttype != "ipv4" or nhtype != "ipv4":
         print("Non-IPv4 route")
         continue
-    print("%15s/%-2d via %-15s" % (inet_ntoa(dst), prefix, inet_ntoa(nh)))
+    nh = bytes(nh)
+    if nh not in nexthops:
+        nexthops[nh] = inet_ntoa(nh)
+    print(f"{inet_ntoa(bytes(dst)):>15}/{prefix:<2d} via {nexthops[nh]:<15}")
@@ -4,26 +4,26 @@
 On Nortel switches, list vlan on all active ports
 """
 
-import os
 import sys
 
 load("SNMPv2-MIB")
 load("IF-MIB")
-load(os.path.expanduser("~/.snmp/mibs/RAPID-CITY-MIB"))
-load(os.path.expanduser("~/.snmp/mibs/RC-VLAN-MIB"))
+load("RAPID-CITY-MIB")
+load("RC-VLAN-MIB")
 
 s = M(host=sys.argv[1], community=sys.argv[2])
 
 vlans = {}
 
-for interface in s.ifIndex:
-    if s.ifOperStatus[interface] == "up":
+for interface, status in s.ifOperStatus.iteritems():
+    if status == "up":
         vlans[int(interface)] = []
 
-for vlan in s.rcVlanId:
+for vlan, (members, name) in s.rcVlanTable.iterrows("rcVlanStaticMembers",
+                                                    "rcVlanName"):
     for interface in vlans:
-        if s.rcVlanStaticMembers[vlan] & interface:
-            vlans[interface].append("{}({})".format(vlan, s.rcVlanName[vlan]))
+        if members & interface:
+            vlans[interface].append(f"{vlan}({name})")
 
 import pprint
 pprint.pprint(vlans)
@@ -7,3 +7,13 @@ try:
     from snimpy._version import __version__  # nopep8
 except ImportError:
     __version__ = '0.0~dev'
+
+
+def __getattr__(name):
+    # Submodules are only imported when needed, importing snimpy
+    # alone should not pull pysnmp or libsmi.
+    if name in ("basictypes", "config", "main", "manager", "mib", "snmp"):
+        import importlib
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
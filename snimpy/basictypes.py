@@ -25,23 +25,132 @@ Python integers. This module is some kind of a hack and its use
 outside of *Snimpy* seems convoluted.
 """
 
-import struct
 import re
+import functools
+import operator
 import ipaddress
+import socket
 from datetime import timedelta
 from pysnmp.proto import rfc1902
 
 from snimpy import mib
 
 
+# Positions of the bits set in each possible byte value, most
+# significant bit first.
+_byteBits = tuple(tuple(j for j in range(8) if x & (0x80 >> j))
+                  for x in range(256))
+
+
+def _setBits(string, indexes):
+    """Set the given bits in a byte array, most significant bit first.
+
+    The array is grown at once if it is too short for the highest bit.
+
+    :param string: A :class:`bytearray` to modify in place
+    :param indexes: An iterable of bit positions
+    :return: the modified array
+    """
+    if indexes:
+        size = (max(indexes) >> 3) + 1
+        if len(string) < size:
+            string.extend(bytes(size - len(string)))
+    for v in indexes:
+        string[v >> 3] |= 0x80 >> (v & 7)
+    return string
+
+
+# Display of integers in octet strings. In octal, the leading 0 is
+# kept.
+_octetFormatters = {"o": "0{:o}".format,
+                    "x": "{:x}".format,
+                    "d": "{:d}".format}
+
+
+@functools.lru_cache(maxsize=None)
+def _integerFormatter(fmt):
+    """Get the function displaying an integer with the given display
+    hint. Return `None` if the hint does not change the display."""
+    if fmt[0] == "x":
+        return hex
+    if fmt[0] == "o":
+        return oct
+    if fmt[0] == "b":
+        return lambda value: ("{:b}".format(value) if value >= 0
+                              else str(value))
+    if fmt[0] == "d" and len(fmt) > 2 and fmt[1] == "-":
+        dec = int(fmt[2:])
+
+        def display(value):
+            result = str(value)
+            if len(result) < dec + 1:
+                result = "0" * (dec + 1 - len(result)) + result
+            return "{}.{}".format(result[:-2], result[-2:])
+        return display
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _octetFormatPattern(format, length):
+    """Compile the regular expression matching one displayed octet
+    group. Return `None` if the format is unknown."""
+    if format == "o":
+        fmatch = "(?P<o>[0-7]{{1,{0}}})".format(int(length * 2.66667) + 1)
+    elif format == "x":
+        fmatch = "(?P<x>[0-9A-Fa-f]{{1,{0}}})".format(length * 2)
+    elif format == "d":
+        fmatch = "(?P<d>[0-9]{{1,{0}}})".format(int(length * 2.4083) + 1)
+    elif format == "a":
+        fmatch = "(?P<a>(?:.|\n){{1,{0}}})".format(length)
+    elif format == "t":
+        fmatch = "(?P<t>(?:.|\n){{1,{0}}})".format(length)
+    else:
+        return None
+    return re.compile(fmatch)
+
+
+@functools.lru_cache(maxsize=None)
+def _octetFormatParts(fmt):
+    """Split an octet string display hint into its parts.
+
+    :param fmt: The display hint
+    :return: A couple `(parts, j)`. `parts` is a tuple of `(dorepeat,
+        length, format, sep, term, pattern)` for each part, `pattern`
+        being the result of :func:`_octetFormatPattern`. `j` is the
+        position of the first part that cannot be parsed or `None`.
+    """
+    parts = []
+    j = 0
+    while j < len(fmt):
+        try:
+            j, dorepeat, length, format, sep, term = \
+                String._parseOctetFormat(fmt, j)
+        except (ValueError, IndexError):
+            # Only report the error if this part is needed
+            return tuple(parts), j
+        parts.append((dorepeat, length, format, sep, term,
+                      _octetFormatPattern(format, length)))
+    return tuple(parts), None
+
+
 def ordering_with_cmp(cls):
-    ops = {'__lt__': lambda self, other: self.__cmp__(other) < 0,
-           '__gt__': lambda self, other: self.__cmp__(other) > 0,
-           '__le__': lambda self, other: self.__cmp__(other) <= 0,
-           '__ge__': lambda self, other: self.__cmp__(other) >= 0,
-           '__eq__': lambda self, other: self.__cmp__(other) == 0,
-           '__ne__': lambda self, other: self.__cmp__(other) != 0}
-    for opname, opfunc in ops.items():
+    ops = {'__lt__': operator.lt,
+           '__gt__': operator.gt,
+           '__le__': operator.le,
+           '__ge__': operator.ge,
+           '__eq__': operator.eq,
+           '__ne__': operator.ne}
+
+    def make(op):
+        def opfunc(self, other):
+            if type(other) is type(self):
+                # Both sides are already built, compare their values
+                return op(self._value, other._value)
+            return op(self.__cmp__(other), 0)
+        return opfunc
+
+    for opname, op in ops.items():
+        opfunc = make(op)
         opfunc.__name__ = opname
         opfunc.__doc__ = getattr(int, opname).__doc__
         setattr(cls, opname, opfunc)
@@ -67,45 +176,31 @@ class Type:
         if entity.type != cls:
             raise ValueError("MIB node is {}. We are {}".format(entity.type,
                                                                 cls))
-
-        if cls == OctetString and entity.fmt is not None:
-            # Promotion of OctetString to String if we have unicode stuff
-            if isinstance(value, (String, str)) or not raw:
-                cls = String
-
-        if not isinstance(value, Type):
-            value = cls._internal(entity, value)
-        else:
-            value = cls._internal(entity, value._value)
-        if issubclass(cls, str):
-            self = str.__new__(cls, value)
-        elif issubclass(cls, bytes):
-            self = bytes.__new__(cls, value)
-        elif issubclass(cls, int):
-            self = int.__new__(cls, value)
+        if isinstance(value, Type):
+            value = value._value
+        return cls._create(entity, value, raw)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Pick the constructor of the builtin type we build upon once
+        # and for all, instead of looking for it on each instance.
+        for builtin in (str, bytes, int):
+            if issubclass(cls, builtin):
+                cls._builtin = builtin.__new__
+                break
         else:
-            self = object.__new__(cls)
+            cls._builtin = lambda cls, value: object.__new__(cls)
+
+    @classmethod
+    def _create(cls, entity, value, raw):
+        """Build an instance from an unwrapped value.
 
+        The type of the MIB node has already been checked.
+        """
+        value = cls._internal(entity, value)
+        self = cls._builtin(cls, value)
         self._value = value
         self.entity = entity
-
-        if cls == OctetString and entity.fmt is not None:
-            # A display-hint propose to use only ascii and UTF-8
-            # chars. We promote an OCTET-STRING to a DisplayString if
-            # we have a format. This means we won't be able to access
-            # individual bytes in this format, only the full displayed
-            # version.
-            value = String._internal(entity, self)
-            self = str.__new__(String, value)
-            self._value = value
-            self.entity = entity
-
-        if isinstance(self, String):
-            # Ensure that strings follow their format, if it is applied.
-            # This is safer and simpler than toOid, as it does not do
-            # additional validation.
-            self._toBytes()
-
         return self
 
     def __init__(self, *args, **kwargs):
@@ -164,7 +259,8 @@ class Type:
         :param entity: entity to check
         :return: `True` if it is fixed-len, `False` otherwise
         """
-        if entity.ranges and not isinstance(entity.ranges, (tuple, list)):
+        ranges = entity.ranges
+        if ranges and not isinstance(ranges, (tuple, list)):
             # Fixed length
             return True
         else:
@@ -184,9 +280,25 @@ class IpAddress(Type, ipaddress.IPv4Address):
 
     """Class representing an IP address/"""
 
+    def __new__(cls, entity, value, raw=True):
+        self = Type.__new__(cls, entity, value, raw)
+        # Those are needed when used as an index or as a key. We
+        # also set the integer value used by IPv4Address methods.
+        self._ip = int(self._value)
+        self._packed = self._value.packed
+        self._oid = tuple(self._packed)
+        self._hash = hash(self._value)
+        return self
+
     @classmethod
     def _internal(cls, entity, value):
         if isinstance(value, (list, tuple)):
+            if len(value) == 4:
+                # Four integers, no need to go through a string
+                try:
+                    return ipaddress.IPv4Address(bytes(value))
+                except (TypeError, ValueError):
+                    pass
             value = ".".join([str(a) for a in value])
         try:
             value = ipaddress.IPv4Address(value)
@@ -195,10 +307,10 @@ class IpAddress(Type, ipaddress.IPv4Address):
         return value
 
     def pack(self):
-        return rfc1902.IpAddress(str(self._value))
+        return rfc1902.IpAddress(self._packed)
 
     def toOid(self, implied=False):
-        return tuple(self._value.packed)
+        return self._oid
 
     @classmethod
     def fromOid(cls, entity, oid, implied=False):
@@ -208,23 +320,62 @@ class IpAddress(Type, ipaddress.IPv4Address):
         return (4, cls(entity, oid[:4]))
 
     def __cmp__(self, other):
-        if not isinstance(other, IpAddress):
+        if isinstance(other, Type):
+            other = other._value
+        if not isinstance(other, ipaddress.IPv4Address):
+            # Only the address is needed, not a full instance
             try:
-                other = IpAddress(self.entity, other)
+                other = self._internal(self.entity, other)
             except Exception:
                 raise NotImplementedError  # pragma: no cover
-        if self._value == other._value:
+        if self._value == other:
             return 0
-        if self._value < other._value:
+        if self._value < other:
             return -1
         return 1
 
+    def __str__(self):
+        return socket.inet_ntoa(self._packed)
+
     def __getitem__(self, nb):
-        return self._value.packed[nb]
+        return self._packed[nb]
+
+    def __hash__(self):
+        return self._hash
+
+
+def _oidBytes(oid):
+    """Convert OID components to bytes, keeping only their low byte."""
+    try:
+        return bytes(oid)
+    except ValueError:
+        return bytes(o & 0xff for o in oid)
 
 
 class StringOrOctetString(Type):
 
+    @classmethod
+    def _create(cls, entity, value, raw):
+        if cls is OctetString:
+            fmt = entity.fmt
+            if fmt is not None:
+                # A display-hint propose to use only ascii and UTF-8
+                # chars. We promote an OCTET-STRING to a DisplayString if
+                # we have a format. This means we won't be able to access
+                # individual bytes in this format, only the full displayed
+                # version.
+                if not isinstance(value, str) and raw:
+                    value = String._fromBytes(
+                        OctetString._internal(entity, value), fmt)
+                cls = String
+        self = super(StringOrOctetString, cls)._create(entity, value, raw)
+        if cls is String:
+            # Ensure that strings follow their format, if it is applied.
+            # This is safer and simpler than toOid, as it does not do
+            # additional validation.
+            self._toBytes()
+        return self
+
     def toOid(self, implied=False):
         # To convert properly to OID, we need to know if it is a
         # fixed-len string, an implied string or a variable-len
@@ -241,10 +392,9 @@ class StringOrOctetString(Type):
 
     @classmethod
     def fromOid(cls, entity, oid, implied=False):
-        oid = tuple(o & 0xff for o in oid)
         if implied:
             # Eat everything
-            return (len(oid), cls(entity, bytes(oid)))
+            return (len(oid), cls(entity, _oidBytes(oid)))
         if cls._fixedLen(entity):
             length = entity.ranges
             if len(oid) < length:
@@ -252,19 +402,19 @@ class StringOrOctetString(Type):
                     "{} is too short for wanted fixed "
                     "string (need at least {:d})".format(oid, length))
             return (length,
-                    cls(entity, bytes(oid[:length])))
+                    cls(entity, _oidBytes(oid[:length])))
 
         # This is var-len
         if not oid:
             raise ValueError("empty OID while waiting for var-len string")
-        length = oid[0]
+        length = oid[0] & 0xff
         if len(oid) < length + 1:
             raise ValueError(
                 "{} is too short for variable-len "
                 "string (need at least {:d})".format(oid, length))
         return (
             (length + 1,
-             cls(entity, bytes(oid[1:(length + 1)]))))
+             cls(entity, _oidBytes(oid[1:(length + 1)]))))
 
     def pack(self):
         return rfc1902.OctetString(self._toBytes())
@@ -290,44 +440,38 @@ class OctetString(StringOrOctetString, bytes):
     def _toBytes(self):
         return self._value
 
-    def __ior__(self, value):
-        nvalue = bytearray(self._value)
+    @staticmethod
+    def _bitIndexes(value):
+        """Normalize the operand of a bit operation to a list of bit
+        indexes."""
         if not isinstance(value, (tuple, list)):
             value = [value]
         for v in value:
             if not isinstance(v, int):
                 raise NotImplementedError(
                     "on string, bit-operation are limited to integers")
-            if len(nvalue) < (v >> 3) + 1:
-                nvalue.extend([0] * ((v >> 3) + 1 - len(self._value)))
-            nvalue[v >> 3] |= 1 << (7 - v % 8)
+        return value
+
+    def __ior__(self, value):
+        value = self._bitIndexes(value)
+        nvalue = _setBits(bytearray(self._value), value)
         return self.__class__(self.entity, bytes(nvalue))
 
     def __isub__(self, value):
+        value = self._bitIndexes(value)
         nvalue = bytearray(self._value)
-        if not isinstance(value, (tuple, list)):
-            value = [value]
         for v in value:
-            if not isinstance(v, int):
-                raise NotImplementedError(
-                    "on string, bit-operation are limited to integers")
             if len(nvalue) < (v >> 3) + 1:
                 continue
-            nvalue[v >> 3] &= ~(1 << (7 - v % 8))
+            nvalue[v >> 3] &= ~(0x80 >> (v & 7))
         return self.__class__(self.entity, bytes(nvalue))
-        return self
 
     def __and__(self, value):
-        nvalue = bytearray(self._value)
-        if not isinstance(value, (tuple, list)):
-            value = [value]
+        value = self._bitIndexes(value)
         for v in value:
-            if not isinstance(v, int):
-                raise NotImplementedError(
-                    "on string, bit-operation are limited to integers")
-            if len(nvalue) < (v >> 3) + 1:
+            if len(self._value) < (v >> 3) + 1:
                 return False
-            if not (nvalue[v >> 3] & (1 << (7 - v % 8))):
+            if not (self._value[v >> 3] & (0x80 >> (v & 7))):
                 return False
         return True
 
@@ -384,15 +528,31 @@ class String(StringOrOctetString, str):
 
     @classmethod
     def _fromBytes(cls, value, fmt):
+        if not value:
+            return ""
+        parts, invalid = _octetFormatParts(fmt)
+        if len(parts) == 1 and invalid is None:
+            # Fast path for the most common display hints, like "1x:"
+            # for MAC addresses or "255a" for strings.
+            dorepeat, length, format, sep, term, _ = parts[0]
+            if not dorepeat and not term:
+                if length == 1 and format in _octetFormatters:
+                    return sep.join(map(_octetFormatters[format], value))
+                if not sep and (format == "a" or
+                                format == "t" and length >= len(value)):
+                    return value.decode(format == "a" and "ascii" or "utf-8")
         i = 0               # Position in value
-        j = 0               # Position in fmt
+        k = 0               # Position in parsed fmt
         result = ""
         term = None
         sep = None
         while i < len(value):
-            if j < len(fmt):
-                j, dorepeat, length, format, sep, term = cls._parseOctetFormat(
-                    fmt, j)
+            if k < len(parts):
+                dorepeat, length, format, sep, term, _ = parts[k]
+                k += 1
+            elif invalid is not None:
+                cls._parseOctetFormat(fmt, invalid)
+            formatter = _octetFormatters.get(format)
 
             # building
             if dorepeat:
@@ -403,21 +563,17 @@ class String(StringOrOctetString, str):
             for r in range(repeat):
                 bb = value[i:i + length]
                 i += length
-                if format in ['o', 'x', 'd']:
+                if formatter is not None:
                     if length > 4:
                         raise ValueError(
                             "don't know how to handle integers "
                             "more than 4 bytes long")
-                    bb = b"\x00" * (4 - length) + bb
-                    number = struct.unpack(b"!l", bb)[0]
-                    if format == "o":
-                        # In Python2, oct() is 01242, while it is 0o1242 in
-                        # Python3
-                        result += "".join(oct(number).partition("o")[0:3:2])
-                    elif format == "x":
-                        result += hex(number)[2:]
-                    else:       # format == "d":
-                        result += str(number)
+                    if len(bb) < length:
+                        raise ValueError(
+                            "{!r} is too short to be represented with "
+                            "the given display string ({})".format(
+                                value, fmt))
+                    result += formatter(int.from_bytes(bb, "big"))
                 elif format == "a":
                     result += bb.decode("ascii")
                 elif format == "t":
@@ -439,33 +595,26 @@ class String(StringOrOctetString, str):
         # not an exact science. In most case, this is easy because a
         # separator is used but sometimes, this is not. We do some
         # black magic that will fail.
+        if not self._value:
+            return b""
         i = 0
-        j = 0
+        k = 0
         fmt = self.entity.fmt
-        bb = b""
+        parts, invalid = _octetFormatParts(fmt)
+        bb = bytearray()
         while i < len(self._value):
-            if j < len(fmt):
-                parsed = self._parseOctetFormat(fmt, j)
-                j, dorepeat, length, format, sep, term = parsed
-                if format == "o":
-                    fmatch = "(?P<o>[0-7]{{1,{0}}})".format(
-                        int(length * 2.66667) + 1)
-                elif format == "x":
-                    fmatch = "(?P<x>[0-9A-Fa-f]{{1,{0}}})".format(length * 2)
-                elif format == "d":
-                    fmatch = "(?P<d>[0-9]{{1,{0}}})".format(
-                        int(length * 2.4083) + 1)
-                elif format == "a":
-                    fmatch = "(?P<a>(?:.|\n){{1,{0}}})".format(length)
-                elif format == "t":
-                    fmatch = "(?P<t>(?:.|\n){{1,{0}}})".format(length)
-                else:
+            if k < len(parts):
+                dorepeat, length, format, sep, term, pattern = parts[k]
+                k += 1
+                if pattern is None:
                     raise ValueError("{!r} cannot be parsed due to an "
                                      "incorrect format ({})".format(
                                          self._value, fmt))
+            elif invalid is not None:
+                self._parseOctetFormat(fmt, invalid)
             repeats = []
             while True:
-                mo = re.match(fmatch, self._value[i:])
+                mo = pattern.match(self._value, i)
                 if not mo:
                     raise ValueError("{!r} cannot be parsed because it "
                                      "does not match format {} at "
@@ -477,10 +626,12 @@ class String(StringOrOctetString, str):
                         r = int(mo.group("x"), 16)
                     else:
                         r = int(mo.group("d"))
-                    result = struct.pack(b"!l", r)[-length:]
+                    # Only keep the low-order bytes that fit the length
+                    result = (r & ((1 << (length * 8)) - 1)).to_bytes(
+                        length, "big")
                 else:
                     result = mo.group(1).encode("utf-8")
-                i += len(mo.group(1))
+                i = mo.end()
                 if dorepeat:
                     repeats.append(result)
                     if i < len(self._value):
@@ -495,7 +646,7 @@ class String(StringOrOctetString, str):
                 else:
                     break
             if dorepeat:
-                bb += bytes([len(repeats)])
+                bb.append(len(repeats))
                 bb += b"".join(repeats)
             else:
                 bb += result
@@ -503,7 +654,7 @@ class String(StringOrOctetString, str):
                                              term and self._value[i] == term):
                     i += 1
 
-        return bb
+        return bytes(bb)
 
     @classmethod
     def _internal(cls, entity, value):
@@ -548,29 +699,11 @@ class Integer(Type, int):
         return (1, cls(entity, oid[0]))
 
     def __str__(self):
-        if self.entity.fmt:
-            if self.entity.fmt[0] == "x":
-                return hex(self._value)
-            if self.entity.fmt[0] == "o":
-                return oct(self._value)
-            if self.entity.fmt[0] == "b":
-                if self._value == 0:
-                    return "0"
-                if self._value > 0:
-                    v = self._value
-                    r = ""
-                    while v > 0:
-                        r = str(v % 2) + r
-                        v = v >> 1
-                    return r
-            elif self.entity.fmt[0] == "d" and \
-                    len(self.entity.fmt) > 2 and \
-                    self.entity.fmt[1] == "-":
-                dec = int(self.entity.fmt[2:])
-                result = str(self._value)
-                if len(result) < dec + 1:
-                    result = "0" * (dec + 1 - len(result)) + result
-                return "{}.{}".format(result[:-2], result[-2:])
+        fmt = self.entity.fmt
+        if fmt:
+            display = _integerFormatter(fmt)
+            if display is not None:
+                return display(self._value)
         return str(self._value)
 
 
@@ -607,9 +740,10 @@ class Enum(Integer):
     def _internal(cls, entity, value):
         if value in entity.enum:
             return value
-        for (k, v) in entity.enum.items():
-            if (v == value):
-                return k
+        try:
+            return entity._enumValues[value]
+        except KeyError:
+            pass
         try:
             return int(value)
         except Exception:
@@ -639,10 +773,9 @@ class Enum(Integer):
         return not self.__eq__(other)
 
     def __str__(self):
-        if self._value in self.entity.enum:
-            return (
-                "{}({:d})".format(self.entity.enum[self._value], self._value)
-            )
+        enum = self.entity.enum
+        if self._value in enum:
+            return "{}({:d})".format(enum[self._value], self._value)
         else:
             return str(self._value)
 
@@ -655,9 +788,13 @@ class Oid(Type):
     @classmethod
     def _internal(cls, entity, value):
         if isinstance(value, (list, tuple)):
-            return tuple(int(v) for v in value)
+            return tuple(map(int, value))
         elif isinstance(value, str):
-            return tuple(int(i) for i in value.split(".") if i)
+            parts = value.split(".")
+            if "" in parts:
+                # Leading, trailing or repeated dots
+                parts = [i for i in parts if i]
+            return tuple(map(int, parts))
         elif isinstance(value, mib.Node):
             return tuple(value.oid)
         else:
@@ -696,12 +833,12 @@ class Oid(Type):
             return (len(oid), cls(entity, oid))
 
     def __str__(self):
-        return ".".join([str(x) for x in self._value])
+        return ".".join(map(str, self._value))
 
     def __cmp__(self, other):
         if not isinstance(other, Oid):
             other = Oid(self.entity, other)
-        if tuple(self._value) == tuple(other._value):
+        if self._value == other._value:
             return 0
         if self._value > other._value:
             return 1
@@ -714,8 +851,12 @@ class Oid(Type):
         """Test if item is a sub-oid of this OID"""
         if not isinstance(item, Oid):
             item = Oid(self.entity, item)
-        return tuple(item._value[:len(self._value)]) == \
-            tuple(self._value[:len(self._value)])
+        # Both values are always tuples
+        return item._value[:len(self._value)] == self._value
+
+    def __hash__(self):
+        # Hash like the tuple we compare equal to
+        return hash(self._value)
 
 
 class Boolean(Enum):
@@ -742,6 +883,9 @@ class Boolean(Enum):
         return self.__nonzero__()
 
 
+_centisecond = timedelta(microseconds=10000)
+
+
 @ordering_with_cmp
 class Timeticks(Type):
 
@@ -759,9 +903,8 @@ class Timeticks(Type):
                 "dunno how to handle {!r} ({})".format(value, type(value)))
 
     def __int__(self):
-        return self._value.days * 3600 * 24 * 100 + \
-            self._value.seconds * 100 + \
-            self._value.microseconds // 10000
+        # Floor division of timedeltas is exact and returns an int
+        return self._value // _centisecond
 
     def toOid(self, implied=False):
         return (int(self),)
@@ -793,6 +936,10 @@ class Timeticks(Type):
             return -1
         return 1
 
+    def __hash__(self):
+        # Hash like the number of centiseconds we compare equal to
+        return hash(int(self))
+
 
 class Bits(Type):
 
@@ -802,17 +949,17 @@ class Bits(Type):
     def _internal(cls, entity, value):
         bits = set()
         tryalternate = False
+        enum = entity.enum
         if isinstance(value, bytes):
             for i, x in enumerate(value):
                 if x == 0:
                     continue
-                for j in range(8):
-                    if x & (1 << (7 - j)):
-                        k = (i * 8) + j
-                        if k not in entity.enum:
-                            tryalternate = True
-                            break
-                        bits.add(k)
+                for j in _byteBits[x]:
+                    k = (i * 8) + j
+                    if k not in enum:
+                        tryalternate = True
+                        break
+                    bits.add(k)
                 if tryalternate:
                     break
             if not tryalternate:
@@ -821,29 +968,18 @@ class Bits(Type):
                 bits = set()
         elif not isinstance(value, (tuple, list, set, frozenset)):
             value = {value}
+        labels = entity._enumValues
         for v in value:
-            found = False
-            if v in entity.enum:
+            if v in enum:
                 bits.add(v)
-                found = True
+            elif v in labels:
+                bits.add(labels[v])
             else:
-                for (k, t) in entity.enum.items():
-                    if (t == v):
-                        bits.add(k)
-                        found = True
-                        break
-            if not found:
                 raise ValueError("{!r} is not a valid bit value".format(v))
         return bits
 
     def pack(self):
-        if self._value:
-            string = [0] * ((max(self._value) // 8) + 1)
-        else:
-            string = []
-        for b in self._value:
-            string[b // 8] |= 1 << (7 - b % 8)
-        return rfc1902.Bits(bytes(string))
+        return rfc1902.Bits(bytes(_setBits(bytearray(), self._value)))
 
     def __eq__(self, other):
         if isinstance(other, str):
@@ -856,10 +992,9 @@ class Bits(Type):
         return not self.__eq__(other)
 
     def __str__(self):
-        result = []
-        for b in sorted(self._value):
-            result.append("{}({:d})".format(self.entity.enum[b], b))
-        return ", ".join(result)
+        enum = self.entity.enum
+        return ", ".join("{}({:d})".format(enum[b], b)
+                         for b in sorted(self._value))
 
     def __and__(self, other):
         if isinstance(other, str):
@@ -889,10 +1024,12 @@ def build(mibname, node, value):
     """Build a new basic type with the given value.
 
     :param mibname: The MIB to use to locate the entity.
-    :param node: The node that will be attached to this type.
+    :param node: The node that will be attached to this type. The
+        attached entity is shared with other values built for the
+        same node, see :func:`mib.getShared`.
     :param value: The initial value to set for the type.
     :return: A :class:`Type` instance
     """
-    m = mib.get(mibname, node)
+    m = mib.getShared(mibname, node)
     t = m.type(m, value)
     return t
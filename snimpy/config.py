@@ -27,6 +27,7 @@ class Conf:
     ipython = True
     ipythonprofile = None  # Set for example to "snimpy"
     mibs = []
+    mibpath = ["~/.snmp/mibs"]  # Additional directories to search MIBs
 
     def load(self, userconf=None):
         if userconf is None:
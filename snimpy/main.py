@@ -38,7 +38,7 @@ import code
 from datetime import timedelta
 
 import snimpy
-from snimpy import manager
+from snimpy import manager, mib
 from snimpy.config import Conf
 
 
@@ -60,6 +60,10 @@ def interact(argv=sys.argv):  # pragma: no cover
     if len(argv) <= 1:
         manager.Manager._complete = True
 
+    if conf.mibpath:
+        mib.path(os.pathsep.join([mib.path()] +
+                                 [os.path.expanduser(p)
+                                  for p in conf.mibpath]))
     for ms in conf.mibs:
         manager.load(ms)
 
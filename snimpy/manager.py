@@ -31,9 +31,19 @@ Here is a simple example of use of this module::
 import inspect
 from time import time
 from collections.abc import MutableMapping, Container, Iterable, Sized
+from pyasn1.codec.ber import encoder
+from pysnmp.proto import rfc1902
 from snimpy import snmp, mib, basictypes
 
 
+def _varbindSize(oid, value):
+    """Compute the encoded size of a variable binding"""
+    # The variable binding is a sequence. Its header takes at most 4
+    # bytes for the sizes we care about.
+    return (len(encoder.encode(rfc1902.ObjectName(oid))) +
+            len(encoder.encode(value.pack())) + 4)
+
+
 class DelegatedSession:
 
     """General class for SNMP session for delegation"""
@@ -53,19 +63,32 @@ class DelayedSetSession(DelegatedSession):
     """SNMP session that is able to delay SET requests.
 
     This is an adapter. The constructor takes the original (not
-    delayed) session.
+    delayed) session. When committing, SET requests are grouped in
+    as few PDU as possible while keeping the estimated size of the
+    variable bindings of each PDU below `maxsize` bytes.
     """
 
-    def __init__(self, session):
+    def __init__(self, session, maxsize=1400):
         DelegatedSession.__init__(self, session)
         self.setters = []
+        self.maxsize = maxsize
 
     def set(self, *args):
         self.setters.extend(args)
 
     def commit(self):
-        if self.setters:
-            self._session.set(*self.setters)
+        # Atomicity is lost when the request has to be split, but the
+        # agent would likely refuse it anyway.
+        chunk, size = [], 0
+        for oid, value in zip(self.setters[0::2], self.setters[1::2]):
+            vsize = _varbindSize(oid, value)
+            if chunk and size + vsize > self.maxsize:
+                self._session.set(*chunk)
+                chunk, size = [], 0
+            chunk.extend((oid, value))
+            size += vsize
+        if chunk:
+            self._session.set(*chunk)
 
 
 class NoneSession(DelegatedSession):
@@ -84,9 +107,9 @@ class NoneSession(DelegatedSession):
                 snmp.SNMPNoSuchObject,
                 snmp.SNMPNoSuchInstance):
             if len(args) > 1:
-                # We can't handle this case yet because we don't know
-                # which value is unavailable.
-                raise
+                # We don't know which value is unavailable, ask for
+                # each of them separately.
+                return tuple(self.get(oid)[0] for oid in args)
             return ((args[0], None),)
 
 
@@ -202,7 +225,9 @@ class Manager:
 
     A context manager is also provided. Any modification issued inside
     the context will be delayed until the end of the context and then
-    grouped into a single SNMP PDU to be executed atomically::
+    grouped into a single SNMP PDU to be executed atomically. When the
+    modifications do not fit into `maxsize` bytes, they are split into
+    several PDU and atomicity is lost::
 
         >>> load("IF-MIB")
         >>> m = Manager("localhost", "private")
@@ -229,7 +254,7 @@ class Manager:
                  community="public", version=2,
                  cache=False, none=False,
                  timeout=None, retries=None,
-                 loose=False, bulk=40,
+                 loose=False, bulk=40, maxsize=1400,
                  # SNMPv3
                  secname=None,
                  authprotocol=None, authpassword=None,
@@ -271,6 +296,12 @@ class Manager:
         :param bulk: Max-repetition to use to speed up MIB walking
             with `GETBULK`. Set to `0` to disable.
         :type bulk: int
+        :param maxsize: Maximum estimated size in bytes of the
+            variable bindings of a single `SET` request when
+            modifications are grouped inside a context. Larger
+            modifications are split into several requests, losing
+            atomicity.
+        :type maxsize: int
         """
         if host is None:
             host = Manager._host
@@ -293,6 +324,7 @@ class Manager:
         if none:
             self._session = NoneSession(self._session)
         self._loose = loose
+        self._maxsize = maxsize
         self._loaded = loaded
 
         # To be able to clone, we save the arguments provided to the
@@ -304,12 +336,10 @@ class Manager:
                                   if a != 'self'}
 
     def _locate(self, attribute):
-        for m in self._loaded:
-            try:
-                a = mib.get(m, attribute)
-                return (m, a)
-            except mib.SMIException:
-                pass
+        try:
+            return mib.locate(self._loaded, attribute)
+        except mib.SMIException:
+            pass
         raise AttributeError("{} not found in any MIBs".format(attribute))
 
     def __getattribute__(self, attribute):
@@ -357,7 +387,7 @@ class Manager:
 
         """In a context, we group all "set" into a single request"""
         self._osession = self._session
-        self._session = DelayedSetSession(self._session)
+        self._session = DelayedSetSession(self._session, self._maxsize)
         return self
 
     def __exit__(self, type, value, traceback):
@@ -387,22 +417,9 @@ class ProxyIter(Proxy, Sized, Iterable, Container):
     """
 
     def _op(self, op, index, *args):
-        if not isinstance(index, tuple):
-            index = (index,)
-        indextype = self.proxy.table.index
-        if len(indextype) != len(index):
-            raise ValueError(
-                "{} column uses the following "
-                "indexes: {!r}".format(self.proxy, indextype))
-        oidindex = []
-        for i, ind in enumerate(index):
-            # Cast to the correct type since we need "toOid()"
-            ind = indextype[i].type(indextype[i], ind, raw=False)
-            implied = self.proxy.table.implied and i == len(index)-1
-            oidindex.extend(ind.toOid(implied))
         result = getattr(
             self.session,
-            op)(self.proxy.oid + tuple(oidindex),
+            op)(self.proxy.oid + self._indexToOid(index),
                 *args)
         if op != "set":
             oid, result = result[0]
@@ -416,11 +433,14 @@ class ProxyIter(Proxy, Sized, Iterable, Container):
             return None
 
     def __contains__(self, object):
+        # A single GET is enough, no need to walk the column
         try:
-            self._op("get", object)
-        except Exception:
+            return self._op("get", object) is not None
+        except (ValueError,
+                snmp.SNMPNoSuchName,
+                snmp.SNMPNoSuchObject,
+                snmp.SNMPNoSuchInstance):
             return False
-        return True
 
     def __iter__(self):
         for k, _ in self.iteritems():
@@ -432,23 +452,101 @@ class ProxyIter(Proxy, Sized, Iterable, Container):
     def items(self, *args, **kwargs):
         return self.iteritems(*args, **kwargs)
 
+    def _tableIndex(self):
+        """Get the indexes of the table and if the last one is implied"""
+        # Retrieving them from libsmi is costly and we need them for
+        # each row.
+        try:
+            return self._index
+        except AttributeError:
+            table = self.proxy.table
+            self._index = (table.index, table.implied)
+            return self._index
+
+    def _indexToOid(self, index):
+        """Convert a complete index to an OID suffix"""
+        if not isinstance(index, tuple):
+            index = (index,)
+        indextype, implied = self._tableIndex()
+        if len(indextype) != len(index):
+            raise ValueError(
+                "{} column uses the following "
+                "indexes: {!r}".format(self.proxy, indextype))
+        oidindex = []
+        for i, ind in enumerate(index):
+            # Cast to the correct type since we need "toOid()"
+            ind = indextype[i].type(indextype[i], ind, raw=False)
+            oidindex.extend(ind.toOid(implied and i == len(index)-1))
+        return tuple(oidindex)
+
+    def _filterOid(self, table_filter):
+        """Convert a partial index to an OID suffix"""
+        if table_filter is None:
+            return ()
+        indexes, _ = self._tableIndex()
+        if len(table_filter) >= len(indexes):
+            raise ValueError("Table filter has too many elements")
+        oid_suffix = []
+        # Convert filter elements to correct types
+        for i, part in enumerate(table_filter):
+            part = indexes[i].type(indexes[i], part, raw=False)
+            # implied = False:
+            #   index never includes last element
+            #   (see 'len(table_filter) >= len(indexes)')
+            oid_suffix.extend(part.toOid(implied=False))
+        return tuple(oid_suffix)
+
+    def _indexFromOid(self, index):
+        """Convert an OID suffix to the corresponding index value"""
+        indexes, implied = self._tableIndex()
+        target = []
+        for i, x in enumerate(indexes):
+            l, o = x.type.fromOid(x, index,
+                                  implied and i == len(indexes)-1)
+            target.append(x.type(x, o))
+            index = index[l:]
+        if len(target) == 1:
+            # Should work most of the time
+            return target[0]
+        return tuple(target)
+
+    def _convertValue(self, column, result):
+        """Convert a raw value to the type of the given column"""
+        if result is not None:
+            try:
+                result = column.type(column, result)
+            except ValueError:
+                if not self._loose:
+                    raise
+        return result
+
+    def _checkEmpty(self, column):
+        """Check if an empty walk is due to an empty or unknown column"""
+        # We did not find any element. Is it because the column is
+        # empty or because the column does not exist. We do a SNMP
+        # GET to know. If we get a "No such instance" exception,
+        # this means the column is empty. If we get "No such
+        # object", this means the column does not exist. We cannot
+        # make such a distinction with SNMPv1.
+        try:
+            self.session.get(column.oid)
+        except snmp.SNMPNoSuchInstance:
+            # OK, the set of result is really empty
+            return
+        except snmp.SNMPNoAccess:
+            # Some implementations seem to return NoAccess (PySNMP is one)
+            return
+        except snmp.SNMPNoSuchName:
+            # SNMPv1, we don't know
+            pass
+        except snmp.SNMPNoSuchObject:
+            # The result is empty because the column is unknown
+            raise
+
     def iteritems(self, table_filter=None):
         count = 0
-        oid = self.proxy.oid
-        indexes = self.proxy.table.index
-
-        if table_filter is not None:
-            if len(table_filter) >= len(indexes):
-                raise ValueError("Table filter has too many elements")
-            oid_suffix = []
-            # Convert filter elements to correct types
-            for i, part in enumerate(table_filter):
-                part = indexes[i].type(indexes[i], part, raw=False)
-                # implied = False:
-                #   index never includes last element
-                #   (see 'len(table_filter) >= len(indexes)')
-                oid_suffix.extend(part.toOid(implied=False))
-            oid += tuple(oid_suffix)
+        base = self.proxy.oid
+        oid = base + self._filterOid(table_filter)
 
         walk_oid = oid
         for noid, result in self.session.walk(oid):
@@ -456,54 +554,17 @@ class ProxyIter(Proxy, Sized, Iterable, Container):
                 noid = None
                 break
             oid = noid
-            if not (len(oid) >= len(walk_oid) and
-                    oid[:len(walk_oid)] ==
-                    walk_oid[:len(walk_oid)]):
+            if oid[:len(walk_oid)] != walk_oid:
                 noid = None
                 break
 
             # oid should be turned into index
-            index = tuple(oid[len(self.proxy.oid):])
-            target = []
-            for i, x in enumerate(indexes):
-                implied = self.proxy.table.implied and i == len(indexes)-1
-                l, o = x.type.fromOid(x, index, implied)
-                target.append(x.type(x, o))
-                index = index[l:]
+            index = self._indexFromOid(oid[len(base):])
             count = count + 1
-            if result is not None:
-                try:
-                    result = self.proxy.type(self.proxy, result)
-                except ValueError:
-                    if not self._loose:
-                        raise
-            if len(target) == 1:
-                # Should work most of the time
-                yield target[0], result
-            else:
-                yield tuple(target), result
+            yield index, self._convertValue(self.proxy, result)
 
         if count == 0:
-            # We did not find any element. Is it because the column is
-            # empty or because the column does not exist. We do a SNMP
-            # GET to know. If we get a "No such instance" exception,
-            # this means the column is empty. If we get "No such
-            # object", this means the column does not exist. We cannot
-            # make such a distinction with SNMPv1.
-            try:
-                self.session.get(self.proxy.oid)
-            except snmp.SNMPNoSuchInstance:
-                # OK, the set of result is really empty
-                return
-            except snmp.SNMPNoAccess:
-                # Some implementations seem to return NoAccess (PySNMP is one)
-                return
-            except snmp.SNMPNoSuchName:
-                # SNMPv1, we don't know
-                pass
-            except snmp.SNMPNoSuchObject:
-                # The result is empty because the column is unknown
-                raise
+            self._checkEmpty(self.proxy)
 
 
 class ProxyTable(ProxyIter):
@@ -524,6 +585,82 @@ class ProxyTable(ProxyIter):
         self.session = session
         self._loose = loose
 
+    def _columns(self, names):
+        """Get the accessible columns matching the given names"""
+        available = [c for c in self.proxy.table.columns if c.accessible]
+        if not names:
+            return available
+        columns = {str(c): c for c in available}
+        try:
+            return [columns[name] for name in names]
+        except KeyError as e:
+            raise ValueError("{} is not an accessible column "
+                             "of {}".format(e.args[0],
+                                            self.proxy.table))
+
+    def getrow(self, index, *columns):
+        """Retrieve several columns of a row with a single request.
+
+            >>> descr, serial = m.entPhysicalTable.getrow(
+            ...     1, "entPhysicalDescr", "entPhysicalSerialNum")
+
+        :param index: Index of the row to retrieve.
+        :param columns: Names of the columns to retrieve. When no
+            column is specified, all accessible columns are retrieved.
+        :return: A tuple with the value of each requested column.
+        """
+        targets = self._columns(columns)
+        suffix = self._indexToOid(index)
+        results = self.session.get(*[c.oid + suffix for c in targets])
+        return tuple(self._convertValue(column, result)
+                     for column, (_, result) in zip(targets, results))
+
+    def iterrows(self, *columns, table_filter=None):
+        """Iterate over the rows of the table, fetching several columns.
+
+        All the requested columns are walked at once: each request
+        sent to the agent retrieves the values of all columns for the
+        same rows. This is more efficient than iterating over a column
+        and then retrieving the other columns for each index.
+
+            >>> for idx, (descr, oper) in m.ifTable.iterrows("ifDescr",
+            ...                                             "ifOperStatus"):
+            ...     print(idx, descr, oper)
+
+        :param columns: Names of the columns to retrieve. When no
+            column is specified, all accessible columns are retrieved.
+        :param table_filter: Partial index to restrict the walk to a
+            subset of the rows.
+        :return: An iterator over tuples `(index, values)` where
+            `values` is a tuple with the value of each requested
+            column (`None` when a row has no value for a column).
+        """
+        targets = self._columns(columns)
+        if table_filter is not None and not isinstance(table_filter, tuple):
+            table_filter = (table_filter,)
+        suffix = self._filterOid(table_filter)
+        bases = [c.oid for c in targets]
+        oids = [base + suffix for base in bases]
+
+        rows = {}
+        for noid, result in self.session.walkmore(*oids):
+            for i, oid in enumerate(oids):
+                if len(noid) > len(oid) and noid[:len(oid)] == oid:
+                    break
+            else:
+                continue
+            index = noid[len(bases[i]):]
+            rows.setdefault(index, [None] * len(targets))[i] = result
+
+        if not rows:
+            for column in targets:
+                self._checkEmpty(column)
+            return
+        for index in sorted(rows):
+            yield (self._indexFromOid(index),
+                   tuple(self._convertValue(targets[i], result)
+                         for i, result in enumerate(rows[index])))
+
 
 class ProxyColumn(ProxyIter, MutableMapping):
     """Proxy for column access"""
@@ -537,7 +674,7 @@ class ProxyColumn(ProxyIter, MutableMapping):
     def __getitem__(self, index):
         # If supplied index is partial we return new ProxyColumn
         # with appended OID suffix
-        idx_len = len(self.proxy.table.index)
+        idx_len = len(self._tableIndex()[0])
         suffix_len = len(self._oid_suffix)
         if isinstance(index, tuple):
             if len(index) + suffix_len < idx_len:
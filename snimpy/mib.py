@@ -40,6 +40,9 @@ class SMIException(Exception):
     inherited from this one."""
 
 
+_unknown = object()             # Not computed yet
+
+
 class Node:
 
     """MIB node. An instance of this class represents a MIB node. It
@@ -53,7 +56,21 @@ class Node:
         :param node: libsmi node supporting this node.
         """
         self.node = node
-        self._override_type = None
+        # Properties queried for each value are only computed once.
+        self._ranges = _unknown
+        self._enum = _unknown
+        self._enumvalues = _unknown
+        self._setOverrideType(None)
+
+    def _setOverrideType(self, t):
+        """Override the libsmi type of the node. Properties depending on
+        the type will be computed again.
+
+        :param t: libsmi type to use or `None` to use the declared one.
+        """
+        self._override_type = t
+        self._type = _unknown
+        self._fmt = _unknown
 
     @property
     def type(self):
@@ -64,6 +81,11 @@ class Node:
             this node, the returned class can be instanciated to get
             an appropriate representation.
         """
+        if self._type is _unknown:
+            self._type = self._basictype()
+        return self._type
+
+    def _basictype(self):
         from snimpy import basictypes
         if self._override_type:
             t = self._override_type
@@ -137,11 +159,11 @@ class Node:
 
         # Easiest way to find the new basetype is to set the override
         # and ask.
-        self._override_type = new_type
+        self._setOverrideType(new_type)
         new_basetype = self.type
 
         if declared_basetype != new_basetype:
-            self._override_type = current_override
+            self._setOverrideType(current_override)
             raise SMIException("override type {1} not compatible with "
                                "basetype of {0}".format(
                                    ffi.string(declared_type.name),
@@ -150,7 +172,7 @@ class Node:
     @typeName.deleter
     def typeName(self):
         """Clears the type override."""
-        self._override_type = None
+        self._setOverrideType(None)
 
     @property
     def fmt(self):
@@ -163,6 +185,11 @@ class Node:
             format available.
 
         """
+        if self._fmt is _unknown:
+            self._fmt = self._lookupFmt()
+        return self._fmt
+
+    def _lookupFmt(self):
         if self._override_type:
             t = self._override_type
         else:
@@ -197,6 +224,11 @@ class Node:
 
         :return: The valid range for this node.
         """
+        if self._ranges is _unknown:
+            self._ranges = self._lookupRanges()
+        return self._ranges
+
+    def _lookupRanges(self):
         t = _smi.smiGetNodeType(self.node)
         if t == ffi.NULL:
             return None
@@ -225,19 +257,47 @@ class Node:
 
         :return: The dictionary of possible values keyed by the integer value.
         """
+        if self._enum is _unknown:
+            self._enum = self._lookupEnum()
+        return self._enum
+
+    def _lookupEnum(self):
         t = _smi.smiGetNodeType(self.node)
         if t == ffi.NULL or t.basetype not in (_smi.SMI_BASETYPE_ENUM,
                                                _smi.SMI_BASETYPE_BITS):
             return None
 
         result = {}
+        convert = self._convert
+        nextNamedNumber = _smi.smiGetNextNamedNumber
         element = _smi.smiGetFirstNamedNumber(t)
         while element != ffi.NULL:
-            result[self._convert(element.value)] = ffi.string(
+            result[convert(element.value)] = ffi.string(
                 element.name).decode("ascii")
-            element = _smi.smiGetNextNamedNumber(element)
+            element = nextNamedNumber(element)
         return result
 
+    @property
+    def _enumValues(self):
+        """Get enum values keyed by their label. This is the reverse of
+        :attr:`enum`, used to convert labels without a linear search.
+
+        :return: The dictionary of possible values keyed by label.
+        """
+        if self._enumvalues is _unknown:
+            self._enumvalues = self._lookupEnumValues()
+        return self._enumvalues
+
+    def _lookupEnumValues(self):
+        enum = self.enum
+        if enum is None:
+            return None
+        values = {}
+        for k, v in enum.items():
+            # Keep the first value if a label is duplicated
+            values.setdefault(v, k)
+        return values
+
     @property
     def accessible(self):
         return (self.node.access not in (_smi.SMI_ACCESS_NOT_IMPLEMENTED,
@@ -302,6 +362,7 @@ class Table(Node):
                 ffi.string(child.name),
                 ffi.string(self.node.name)))
         columns = []
+        nextChildNode = _smi.smiGetNextChildNode
         child = _smi.smiGetFirstChildNode(child)
         while child != ffi.NULL:
             if child.nodekind != _smi.SMI_NODEKIND_COLUMN:
@@ -309,7 +370,7 @@ class Table(Node):
                     ffi.string(child.name),
                     ffi.string(self.node.name)))
             columns.append(Column(child))
-            child = _smi.smiGetNextChildNode(child)
+            child = nextChildNode(child)
         return columns
 
     @property
@@ -446,6 +507,9 @@ class Notification(Node):
 
 
 _lastError = None
+_loaded = {}                    # MIB name or path -> module name
+_shared = {}                    # (MIB name, node name) -> shared node
+_located = {}                   # (MIB names, node name) -> (MIB, node)
 
 
 @ffi.callback("void(char *, int, int, char *, char*)")
@@ -461,6 +525,9 @@ def _logError(path, line, severity, msg, tag):
 def reset():
     """Reset libsmi to its initial state."""
     _smi.smiExit()
+    _loaded.clear()
+    _shared.clear()
+    _located.clear()
     try:
         if _smi.smiInit(b"snimpy") < 0:
             raise SMIException("unable to init libsmi")
@@ -546,6 +613,52 @@ def get(mib, name):
     return pnode(node)
 
 
+def getShared(mib, name):
+    """Get a node by its name, reusing a node already returned.
+
+    Contrary to :func:`get`, the same node is returned each time, until
+    :func:`reset` is called. libsmi is only queried once and what the
+    node computes lazily (type, format, enumeration) is kept between
+    calls. As the node is shared, do not override its type with
+    :attr:`Node.typeName`: use a node returned by :func:`get` instead.
+
+    :param mib: The MIB name to query
+    :param name: The object name to get from the MIB
+    :return: the requested MIB node (:class:`Node`)
+    """
+    try:
+        return _shared[mib, name]
+    except KeyError:
+        node = _shared[mib, name] = get(mib, name)
+        return node
+
+
+def locate(mibs, name):
+    """Get a node by its name from the first MIB defining it.
+
+    The result is remembered until :func:`reset` is called. The node
+    is shared, like the ones returned by :func:`getShared`.
+
+    :param mibs: The MIB names to search, in order
+    :param name: The object name to get
+    :return: a tuple `(mib, node)` with the name of the MIB defining
+        the node and the node itself (:class:`Node`)
+    """
+    key = (tuple(mibs), name)
+    try:
+        return _located[key]
+    except KeyError:
+        pass
+    for mib in mibs:
+        try:
+            node = getShared(mib, name)
+        except SMIException:
+            continue
+        result = _located[key] = (mib, node)
+        return result
+    raise SMIException("no node named {}".format(name))
+
+
 def getByOid(oid):
     """Get a node by its OID.
 
@@ -587,11 +700,16 @@ def _get_kind(mib, kind):
     module = _get_module(mib)
     if module is None:
         raise SMIException("no module named {}".format(mib))
+    # Large MIBs have thousands of nodes: resolve everything used in
+    # the loop only once.
+    cls = _kind2object(kind)
+    nextNode = _smi.smiGetNextNode
+    null = ffi.NULL
     lnode = []
     node = _smi.smiGetFirstNode(module, kind)
-    while node != ffi.NULL:
-        lnode.append(_kind2object(kind)(node))
-        node = _smi.smiGetNextNode(node, kind)
+    while node != null:
+        lnode.append(cls(node))
+        node = nextNode(node, kind)
     return lnode
 
 
@@ -654,6 +772,10 @@ def load(mib):
     """
     if not isinstance(mib, bytes):
         mib = mib.encode("ascii")
+    # Don't parse the same file again if it is already loaded
+    modulename = _loaded.get(mib)
+    if modulename is not None and _get_module(modulename):
+        return modulename
     modulename = _smi.smiLoadModule(mib)
     if modulename == ffi.NULL:
         raise SMIException("unable to find {} (check the path)".format(mib))
@@ -665,6 +787,7 @@ def load(mib):
                                       details)
         raise SMIException(
             "{} contains major SMI error ({})".format(mib, details))
+    _loaded[mib] = modulename
     return modulename
 
 
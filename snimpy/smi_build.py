@@ -21,6 +21,9 @@
 .. _CFFI: http://cffi.readthedocs.io/
 """
 
+import functools
+import subprocess
+
 from cffi import FFI
 
 _CDEF = """
@@ -170,16 +173,63 @@ _SOURCE = """
 #include <smi.h>
 """
 
+
+@functools.lru_cache(maxsize=None)
+def _pkgconfig():
+    """Return build arguments for libsmi, as known by pkg-config.
+
+    Compile and link flags are retrieved with a single call and
+    sorted by prefix. The library directory is also recorded as a
+    runtime search path so that the dynamic loader finds libsmi right
+    away, even outside of the standard locations. The result is
+    cached and only computed when a build is requested.
+    """
+    kwargs = dict(libraries=["smi"],
+                  include_dirs=[],
+                  library_dirs=[],
+                  runtime_library_dirs=[],
+                  extra_compile_args=[],
+                  extra_link_args=[])
+    try:
+        flags = subprocess.check_output(
+            ["pkg-config", "--cflags", "--libs", "libsmi"],
+            stderr=subprocess.DEVNULL).decode().split()
+    except (OSError, subprocess.CalledProcessError):
+        return kwargs
+    flags = iter(flags)
+    for flag in flags:
+        if flag.startswith("-I"):
+            kwargs["include_dirs"].append(flag[2:])
+        elif flag.startswith("-L"):
+            kwargs["library_dirs"].append(flag[2:])
+            kwargs["runtime_library_dirs"].append(flag[2:])
+        elif flag.startswith("-l"):
+            if flag[2:] not in kwargs["libraries"]:
+                kwargs["libraries"].append(flag[2:])
+        elif flag == "-framework":
+            kwargs["extra_link_args"].extend([flag, next(flags, "")])
+        elif flag.startswith("-Wl,") or flag == "-pthread":
+            if flag not in kwargs["extra_link_args"]:
+                kwargs["extra_link_args"].append(flag)
+        else:
+            kwargs["extra_compile_args"].append(flag)
+    return kwargs
+
+
 ffi = FFI()
 ffi.cdef(_CDEF)
-if hasattr(ffi, 'set_source'):
-    ffi.set_source("snimpy._smi", _SOURCE,
-                   libraries=["smi"])
+
+
+def get_ffi():
+    """Return the FFI object, ready to build the :mod:`snimpy._smi`
+    extension. This is what ``cffi_modules`` refers to."""
+    ffi.set_source("snimpy._smi", _SOURCE, **_pkgconfig())
+    return ffi
 
 
 def get_lib():
-    return ffi.verify(_SOURCE, libraries=["smi"])
+    return ffi.verify(_SOURCE, **_pkgconfig())
 
 
 if __name__ == "__main__":
-    ffi.compile()
+    get_ffi().compile()
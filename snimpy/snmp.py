@@ -132,12 +132,8 @@ class Session:
         self._version = version
         self._none = none
         if version == 3:
-            self._cmdgen = cmdgen.CommandGenerator()
             self._contextname = contextname
         else:
-            if not hasattr(self._tls, "cmdgen"):
-                self._tls.cmdgen = cmdgen.CommandGenerator()
-            self._cmdgen = self._tls.cmdgen
             self._contextname = None
         if version == 1 and none:
             raise ValueError("None-GET requests not compatible with SNMPv1")
@@ -184,6 +180,20 @@ class Session:
         else:
             raise ValueError("unsupported SNMP version {}".format(version))
 
+        # Share the SNMP engine (and its socket) with other sessions
+        # of the same thread. With SNMPv3, the engine only knows one
+        # set of credentials for a given user.
+        if version == 3:
+            key = (secname, authprotocol, authpassword,
+                   privprotocol, privpassword)
+        else:
+            key = None
+        if not hasattr(self._tls, "cmdgens"):
+            self._tls.cmdgens = {}
+        if key not in self._tls.cmdgens:
+            self._tls.cmdgens[key] = cmdgen.CommandGenerator()
+        self._cmdgen = self._tls.cmdgens[key]
+
         # Put transport stuff into self._transport
         mo = re.match(r'^(?:'
                       r'\[(?P<ipv6>[\d:A-Fa-f]+)\]|'
@@ -279,13 +289,13 @@ class Session:
                 raise globals()[exc]
             raise SNMPException(errorStatus.prettyPrint())
         if cmd in [self._cmdgen.getCmd, self._cmdgen.setCmd]:
-            results = [(tuple(name), val) for name, val in varBinds]
+            results = [(name.asTuple(), val) for name, val in varBinds]
         else:
-            results = [(tuple(name), val)
-                       for row in varBinds for name, val in row]
-            if len(results) > 0 and isinstance(results[-1][1],
-                                               rfc1905.EndOfMibView):
-                results = results[:-1]
+            # When walking several OIDs at once, one of them may reach
+            # the end of the MIB before the others.
+            results = [(name.asTuple(), val)
+                       for row in varBinds for name, val in row
+                       if not isinstance(val, rfc1905.EndOfMibView)]
         if len(results) == 0:
             if cmd not in [self._cmdgen.nextCmd, self._cmdgen.bulkCmd]:
                 raise SNMPException("empty answer")
@@ -318,8 +328,9 @@ class Session:
             # Let's try to ask for less values. We will never increase
             # bulk again. We cannot increase it just after the walk
             # because we may end up requesting everything twice (or
-            # more).
-            nbulk = self.bulk / 2 or False
+            # more). Once we cannot halve it anymore, we fallback to
+            # GETNEXT.
+            nbulk = self.bulk // 2 or False
             if nbulk != self.bulk:
                 self.bulk = nbulk
                 return self.walk(*oids)
@@ -335,8 +346,7 @@ class Session:
         return ((noid, result)
                 for oid in oids
                 for noid, result in self.walkmore(oid)
-                if (len(noid) >= len(oid) and
-                    noid[:len(oid)] == oid[:len(oid)]))
+                if noid[:len(oid)] == oid)
 
     def set(self, *args):
 
@@ -36,6 +36,12 @@ class TestBasicTypes(unittest.TestCase):
                           basictypes.build, ("SNIMPY-MIB",
                                              "snimpyInteger", [1, 2, 3]))
 
+    def testBuildSameNode(self):
+        """Test build() looks up a node only once"""
+        a = basictypes.build("SNIMPY-MIB", "snimpyInteger", 18)
+        b = basictypes.build("SNIMPY-MIB", "snimpyInteger", 19)
+        self.assertIs(a.entity, b.entity)
+
     def testString(self):
         """Test string basic type"""
         a = basictypes.build("SNIMPY-MIB", "snimpyString", b"hello")
@@ -108,6 +114,14 @@ class TestBasicTypes(unittest.TestCase):
                              ipaddress.IPv4Address("1.2.3.4"))
         self.assertEqual(a, [1, 2, 3, 4])
 
+    def testIpAddressHash(self):
+        """Test IP address can be used as a key"""
+        a = basictypes.build("SNIMPY-MIB", "snimpyIpAddress", "10.0.4.5")
+        b = basictypes.build("SNIMPY-MIB", "snimpyIpAddress", [10, 0, 4, 5])
+        self.assertEqual({a: 1}[b], 1)
+        self.assertEqual(hash(a), hash(ipaddress.IPv4Address("10.0.4.5")))
+        self.assertEqual(a.packed, b"\x0a\x00\x04\x05")
+
     @unittest.expectedFailure
     def testIpAddressXFail(self):
         """Test incomplete IP addresses."""
@@ -187,6 +201,24 @@ class TestBasicTypes(unittest.TestCase):
         self.assertEqual(a or b, True)
         self.assertEqual(a and b, False)
 
+    def testOidHash(self):
+        """Test OID can be used as a key"""
+        a = basictypes.build("SNIMPY-MIB", "snimpyObjectId", "1.3.6.1.2")
+        b = basictypes.build("SNIMPY-MIB", "snimpyObjectId", (1, 3, 6, 1, 2))
+        self.assertEqual({a: 1}[b], 1)
+        self.assertEqual(hash(a), hash((1, 3, 6, 1, 2)))
+        self.assertEqual(len({a, (1, 3, 6, 1, 2)}), 1)
+        self.assertEqual({(1, 3, 6, 1, 2): 1}[a], 1)
+
+    def testTimeticksHash(self):
+        """Test timeticks can be used as a key"""
+        a = basictypes.build("SNIMPY-MIB", "snimpyTimeticks", 676544)
+        b = basictypes.build("SNIMPY-MIB", "snimpyTimeticks",
+                             timedelta(0, 6765, 440000))
+        self.assertEqual({a: 1}[b], 1)
+        self.assertEqual(len({a, 676544}), 1)
+        self.assertEqual({676544: 1}[a], 1)
+
     def testTimeticks(self):
         """Test timeticks basic type"""
         a = basictypes.build("SNIMPY-MIB", "snimpyTimeticks", 676544)
@@ -276,6 +308,9 @@ class TestBasicTypes(unittest.TestCase):
         self.assertEqual(a, b"\x37\x20\x00")
         a |= 31
         self.assertEqual(a, b"\x37\x20\x00\x01")
+        a = basictypes.build("SNIMPY-MIB", "snimpyOctetString", b"")
+        a |= [1, 2, 30]
+        self.assertEqual(a, b"\x60\x00\x00\x02")
 
     def testPacking(self):
         """Test pack() function"""
@@ -451,6 +486,18 @@ class TestBasicTypes(unittest.TestCase):
                                  b"aatest")
             self.assertEqual(str(a), "aa74:65:73:74")
 
+            e.return_value = "4d"
+            a = basictypes.build("SNIMPY-MIB", "snimpyString",
+                                 b"\x80\x00\x00\x01")
+            self.assertEqual(str(a), "2147483649")
+            self.assertEqual(a.pack(), b"\x80\x00\x00\x01")
+            e.return_value = "4x"
+            a = basictypes.build("SNIMPY-MIB", "snimpyString",
+                                 b"\xff\xff\xff\xff")
+            self.assertEqual(str(a), "ffffffff")
+            self.assertRaises(ValueError, basictypes.build,
+                              "SNIMPY-MIB", "snimpyString", b"\xff\xff")
+
             e.return_value = "*2a+1a:-*3a?="
             a = basictypes.build("SNIMPY-MIB", "snimpyString",
                                  b"\x04testtestZ\x02testes\x03testestes")
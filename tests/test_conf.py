@@ -15,6 +15,7 @@ class TestConf(unittest.TestCase):
         loaded = conf.load()
         self.assertEqual(conf, loaded)
         self.assertEqual(conf.mibs, [])
+        self.assertEqual(conf.mibpath, ["~/.snmp/mibs"])
         self.assertEqual(conf.ipython, True)
         self.assertEqual(conf.prompt, "\033[1m[snimpy]>\033[0m ")
 
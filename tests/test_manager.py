@@ -94,9 +94,8 @@ class TestManagerGet(TestManager):
         """Test proxy column membership checking code"""
         self.assertEqual(2 in self.manager.ifDescr,
                          True)
-        # FIXME: this currently fails under TestManagerWithNone
-        # self.assertEqual(10 in self.manager.ifDescr,
-        #                 False)
+        self.assertEqual(10 in self.manager.ifDescr,
+                         False)
 
     def testWalkIfDescr(self):
         """Test we can walk IF-MIB::ifDescr and IF-MIB::ifTpe"""
@@ -116,6 +115,35 @@ class TestManagerGet(TestManager):
                           (2, "eth0", 6),
                           (3, "eth1", 6)])
 
+    def testWalkSeveralColumns(self):
+        """Test we can walk several columns of IF-MIB::ifTable at once"""
+        results = list(self.manager.ifTable.iterrows("ifDescr", "ifType"))
+        self.assertEqual(results,
+                         [(1, ("lo", 24)),
+                          (2, ("eth0", 6)),
+                          (3, ("eth1", 6))])
+
+    def testWalkSeveralColumnsWithPartialIndexes(self):
+        """Test we can walk several columns given a partial index"""
+        results = list(self.manager.ifRcvAddressTable.iterrows(
+            "ifRcvAddressStatus", "ifRcvAddressType", table_filter=2))
+        self.assertEqual(results,
+                         [((2, "61:62:63:64:65:66"), (1, 1)),
+                          ((2, "67:68:69:6a:6b:6c"), (1, 1))])
+
+    def testWalkSeveralColumnsInvalidColumn(self):
+        """Test we cannot walk a column not in the table"""
+        self.assertRaises(ValueError,
+                          lambda: list(self.manager.ifTable.iterrows(
+                              "ifDescr", "sysDescr")))
+
+    def testGetRow(self):
+        """Test we can get several columns of a row at once"""
+        self.assertEqual(self.manager.ifTable.getrow(2, "ifDescr", "ifType"),
+                         ("eth0", 6))
+        self.assertRaises(ValueError,
+                          self.manager.ifTable.getrow, 2, "sysDescr")
+
     def testWalkNotAccessible(self):
         """Test we can walk a table with the first entry not accessible."""
         list(self.manager.ifRcvAddressTable)
@@ -357,6 +385,25 @@ class TestManagerSet(TestManager):
         self.assertEqual(m.snimpyString, "Noooooo!")
         self.assertEqual(m.snimpyInteger, 42)
 
+    def testSetWithContextSplit(self):
+        """Split several values in several requests when too large"""
+        manager = Manager(host="127.0.0.1:{}".format(self.agent.port),
+                          community="public",
+                          version=2, maxsize=30)
+        requests = []
+        set = manager._session.set
+
+        def record(*args):
+            requests.append(args)
+            return set(*args)
+        manager._session.set = record
+        with manager as m:
+            m.snimpyString = "Noooooo!"
+            m.snimpyInteger = 42
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(m.snimpyString, "Noooooo!")
+        self.assertEqual(m.snimpyInteger, 42)
+
     def testSetWithContextAndAbort(self):
         """Check if writing several values atomically can be aborted"""
         try:
@@ -409,6 +456,13 @@ class TestManagerWithNone(TestManagerGet):
         self.assertEqual(self.manager.ifName[47], None)
         self.assertEqual(self.manager.ifDescr[47], None)
 
+    def testGetRowInexistentStuff(self):
+        """Try to get a row with missing values"""
+        self.assertEqual(self.manager.ifTable.getrow(47, "ifDescr", "ifType"),
+                         (None, None))
+        self.assertEqual(self.manager.ifTable.getrow(2, "ifDescr", "ifMtu"),
+                         ("eth0", None))
+
 
 class TestCachingManager(TestManagerGet):
 
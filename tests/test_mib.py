@@ -135,6 +135,32 @@ class TestMibSnimpy(unittest.TestCase):
             self.assertTrue(isinstance(mib.get('SNIMPY-MIB', i),
                                        mib.Notification))
 
+    def testGetShared(self):
+        """Test shared nodes are kept until reset"""
+        a = mib.getShared("SNIMPY-MIB", "snimpyInteger")
+        self.assertIs(mib.getShared("SNIMPY-MIB", "snimpyInteger"), a)
+        self.assertIsNot(mib.get("SNIMPY-MIB", "snimpyInteger"), a)
+        self.assertRaises(mib.SMIException,
+                          mib.getShared, "SNIMPY-MIB", "snimpyInexistant")
+        mib.reset()
+        mib.load(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "SNIMPY-MIB.mib"))
+        self.assertIsNot(mib.getShared("SNIMPY-MIB", "snimpyInteger"), a)
+
+    def testLocate(self):
+        """Test locating a node in several MIBs"""
+        mibs = [b"SNMPv2-SMI", b"SNIMPY-MIB"]
+        m, a = mib.locate(mibs, "snimpyInteger")
+        self.assertEqual(m, b"SNIMPY-MIB")
+        self.assertEqual(str(a), "snimpyInteger")
+        self.assertIs(mib.locate(mibs, "snimpyInteger")[1], a)
+        self.assertRaises(mib.SMIException,
+                          mib.locate, mibs, "snimpyInexistant")
+        mib.reset()
+        mib.load(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "SNIMPY-MIB.mib"))
+        self.assertIsNot(mib.locate(mibs, "snimpyInteger")[1], a)
+
     def testGetByOid(self):
         """Test that we can get all named attributes by OID."""
         for i in self.scalars:
@@ -310,6 +336,15 @@ class TestMibSnimpy(unittest.TestCase):
         for module in self.expected_modules:
             self.assertTrue(module in list(mib.loadedMibNames()))
 
+    def testLoadTwice(self):
+        """Check that loading a MIB again gives the same module"""
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "SNIMPY-MIB.mib")
+        self.assertEqual(mib.load(path), b"SNIMPY-MIB")
+        self.assertEqual(mib.load(path), b"SNIMPY-MIB")
+        mib.reset()
+        self.assertEqual(mib.load(path), b"SNIMPY-MIB")
+
     def testLoadInexistantModule(self):
         """Check that we get an exception when loading an inexistant module"""
         self.assertRaises(mib.SMIException, mib.load, "idontexist.gfdgfdg")
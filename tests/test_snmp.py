@@ -119,6 +119,48 @@ class TestSnmpSession(unittest.TestCase):
                      authprotocol=auth, authpassword="authpass",
                      privprotocol=None)
 
+    def testBulkTooBig(self):
+        """Check GETBULK is shrunk on tooBig and then falls back to GETNEXT"""
+        session = snmp.Session(host="localhost",
+                               community="public",
+                               version=2,
+                               bulk=3)
+        calls = []
+
+        def op(cmd, *args):
+            if cmd == session._cmdgen.bulkCmd:
+                calls.append(args[1])
+                raise snmp.SNMPTooBig("tooBig")
+            calls.append(None)
+            return [((1, 3, 6, 1, 2, 1), b"value")]
+        session._op = op
+        self.assertEqual(list(session.walk((1, 3, 6, 1, 2))),
+                         [((1, 3, 6, 1, 2, 1), b"value")])
+        self.assertEqual(calls, [3, 1, None])
+        self.assertEqual([type(c) for c in calls[:-1]], [int, int])
+        self.assertIs(session.bulk, False)
+
+    def testSharedEngineV3(self):
+        """Check SNMPv3 engines are per credentials and per thread"""
+        params = dict(host="localhost",
+                      version=3,
+                      secname="readonly",
+                      authprotocol="MD5", authpassword="authpass",
+                      privprotocol="AES", privpassword="privpass")
+        session = snmp.Session(**params)
+        self.assertIs(snmp.Session(**params)._cmdgen, session._cmdgen)
+        for other in (dict(params, authpassword="authpass2"),
+                      dict(params, privpassword="privpass2")):
+            self.assertIsNot(snmp.Session(**other)._cmdgen,
+                             session._cmdgen)
+        engines = []
+        thread = threading.Thread(
+            target=lambda: engines.append(snmp.Session(**params)._cmdgen))
+        thread.start()
+        thread.join()
+        self.assertEqual(len(engines), 1)
+        self.assertIsNot(engines[0], session._cmdgen)
+
 
 class TestSnmp1(unittest.TestCase):
 
@@ -313,6 +355,13 @@ class TestSnmp1(unittest.TestCase):
         self.assertEqual(a1, b"Snimpy Test Agent public")
         self.assertEqual(a2, b"Snimpy Test Agent private")
 
+    def testSharedEngine(self):
+        """Test sessions with the same credentials share an engine."""
+        params = self.setUpSession(self.agent, 'public')
+        session1 = snmp.Session(**params)
+        session2 = snmp.Session(**params)
+        self.assertIs(session1._cmdgen, session2._cmdgen)
+
     @unittest.skipIf(platform.python_implementation() == "PyPy",
                      "unreliable test with Pypy")
     def testMultipleThreads(self):